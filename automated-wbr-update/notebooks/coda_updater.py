@@ -9,18 +9,163 @@ Usage:
     updater = CodaUpdater(api_token="your_token")
     updater.update_partner_metrics(partner_name, metrics, page_id)
     
+    # Or as a context manager so the HTTP session is closed when done
+    with CodaUpdater(api_token="your_token") as updater:
+        updater.update_partner_metrics(partner_name, metrics, page_id)
+    
     # Or parse URL directly
     doc_id, table_id = parse_coda_url("https://coda.io/d/doc_id/table_name_tableId#pageId")
 """
 
+import hashlib
+import json
+import logging
 import os
 import re
 import requests
-from typing import Dict, Optional, Tuple, List
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional, Set, Tuple, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns for parse_coda_url (full URL with table, then doc-only fallback)
+_CODA_URL_RE = re.compile(r'/d/[^/]+_d?([A-Za-z0-9]+)/(?:[^#]+_)?([A-Za-z0-9]+)')
+_CODA_URL_RE_FALLBACK = re.compile(r'/d/[^/]+_d?([A-Za-z0-9]+)')
+
+# (connect, read) timeouts in seconds for every Coda request
+REQUEST_TIMEOUT = (5.0, 30.0)
+
+# Page size for list endpoints (Coda's maximum, so most docs list in a single request)
+LIST_PAGE_SIZE = 500
+
+# Upper bound on in-flight requests per fan-out (stays under Coda's rate limits)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Maximum rows sent in a single upsert request
+MAX_BATCH = 100
+
+# Where per-table row hashes are kept between runs (used to skip unchanged upserts)
+ROW_HASH_CACHE_DIR = Path.home() / ".cache" / "coda_updater"
+
+# Accounts table schema: (Coda column, account field, coercion or None to pass through, default)
+_ACCOUNT_FIELDS = (
+    ("Account ID", "account_id", str, ""),
+    ("Owner Email", "owner_email", None, ""),
+    ("Company Name", "company_name", None, ""),
+    ("Plan Name", "plan_name", None, ""),
+    ("Plan Family", "plan_family", None, ""),
+    ("Plan ARR (USD)", "plan_arr", float, 0),
+    ("Upmarket Customer", "upmarket_customer", None, "No"),
+    ("Role Vertical", "role_vertical", None, ""),
+    ("Role Clean", "role_clean", None, ""),
+    ("Company Size", "company_size", None, ""),
+    ("Apps Used (28d)", "apps_used_28d", int, 0),
+    ("Tasks Success Billable", "tasks_success_billable", int, 0),
+)
+
+
+def _chunked(items: list, size: int):
+    """Yield successive lists of at most `size` items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies REQUEST_TIMEOUT unless a call passes its own timeout"""
+    
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = REQUEST_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+class _CodaRetry(Retry):
+    """Retry policy that only resends a POST when Coda rate limited it (429)
+    
+    A 429 means the write was rejected, so resending can't add a row twice. After a 5xx or a
+    read timeout the insert may already have been applied, so those POSTs are not retried.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a request body to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    """
+    Parse a JSON response body (orjson when available)
+    
+    Like response.json(), a body that isn't valid JSON raises requests' JSONDecodeError, which
+    is a requests.RequestException, so callers' request error handling covers it.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, 'msg', str(e)), getattr(e, 'doc', ''), getattr(e, 'pos', 0)
+        ) from e
+
+
+def content_hash(content) -> str:
+    """Stable hash of JSON-like content (key order doesn't matter)"""
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def read_json_cache(path: Path) -> Dict:
+    """Load a JSON cache file (empty if missing or unreadable)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
+def write_json_cache(path: Path, data: Dict):
+    """Persist a JSON cache file; a failed write only costs skipping work on the next run"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.warning("Could not write cache %s: %s", path, e)
+
+
+def _row_hash(row_data: Dict) -> str:
+    """Stable hash of a row's content, ignoring the Last Updated stamp"""
+    return content_hash({k: v for k, v in row_data.items() if k != "Last Updated"})
+
+
+def _last_updated_stamp() -> str:
+    """Today's date as written to "Last Updated" columns"""
+    return datetime.now().strftime("%m/%d/%Y")
+
+
+@lru_cache(maxsize=128)
 def parse_coda_url(url: str) -> Tuple[str, Optional[str]]:
     """
     Parse Coda URL to extract document ID and table ID
@@ -33,14 +178,14 @@ def parse_coda_url(url: str) -> Tuple[str, Optional[str]]:
     """
     # Pattern: https://coda.io/d/{doc_name}_{doc_id}/{table_name}_{table_id}#{page_id}
     # Note: URL may have 'd' prefix in doc_id (e.g., dG4dJxxWn4e) but API uses without it (G4dJxxWn4e)
-    match = re.search(r'/d/[^/]+_d?([A-Za-z0-9]+)/(?:[^#]+_)?([A-Za-z0-9]+)', url)
+    match = _CODA_URL_RE.search(url)
     if match:
         doc_id = match.group(1)
         table_id = match.group(2) if match.group(2) else None
         return doc_id, table_id
     
     # Fallback: try to extract just doc_id (handle optional 'd' prefix)
-    match = re.search(r'/d/[^/]+_d?([A-Za-z0-9]+)', url)
+    match = _CODA_URL_RE_FALLBACK.search(url)
     if match:
         return match.group(1), None
     
@@ -73,6 +218,46 @@ class CodaUpdater:
         
         if not self.api_token:
             raise ValueError("Coda API token required. Set CODA_API_TOKEN env var or pass api_token parameter.")
+        
+        # Persistent session: keep-alive and connection pooling instead of a new TLS handshake per call
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        # Back off on rate limits and transient server errors, honoring Retry-After. POSTs are
+        # only retried on 429 (see _CodaRetry) since plain row inserts aren't idempotent; once
+        # retries run out the last response is returned so callers see a normal HTTPError
+        # from raise_for_status()
+        retry = _CodaRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "DELETE"),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Every call goes to coda.io, so a single host pool is enough. Concurrent sections and
+        # per-row fallbacks can exceed the pool size; block until a warm connection frees up
+        # rather than opening throwaway TLS connections past the limit
+        self._session.mount(
+            "https://",
+            _TimeoutHTTPAdapter(pool_connections=1, pool_maxsize=20, pool_block=True, max_retries=retry)
+        )
+        
+        # (doc_id, table_name, include_views) -> table_id, primed by list_tables
+        self._table_id_cache: Dict[Tuple[str, str, bool], Optional[str]] = {}
+        # (doc_id, include_views) pairs whose full table listing is cached, so misses are definitive
+        self._listed_docs: Set[Tuple[str, bool]] = set()
+        # (doc_id, table_id) -> column list; a doc's column IDs don't change between calls
+        self._columns_cache: Dict[Tuple[str, str], List[Dict]] = {}
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get API request headers"""
@@ -81,6 +266,10 @@ class CodaUpdater:
             "Content-Type": "application/json"
         }
     
+    def _table_url(self, table_id: str, doc_id: str) -> str:
+        """Base API URL for a table"""
+        return f"{self.base_url}/docs/{doc_id}/tables/{table_id}"
+    
     def list_tables(self, doc_id: Optional[str] = None, include_views: bool = True) -> Dict:
         """List all tables in a Coda document (handles pagination)"""
         doc_id = doc_id or self.doc_id
@@ -88,19 +277,19 @@ class CodaUpdater:
             raise ValueError("Document ID required")
         
         url = f"{self.base_url}/docs/{doc_id}/tables"
-        params = {'limit': 100}
-        if include_views:
-            params['tableTypes'] = 'table,view'
+        params = {'limit': LIST_PAGE_SIZE}
+        params['tableTypes'] = 'table,view' if include_views else 'table'
         
         all_items = []
         page_token = None
         
+        # Pages are chained through nextPageToken, so they can't be fetched ahead of time
         while True:
             if page_token:
                 params['pageToken'] = page_token
-            response = requests.get(url, headers=self._get_headers(), params=params)
+            response = self._session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             items = data.get('items', [])
             all_items.extend(items)
@@ -109,15 +298,54 @@ class CodaUpdater:
             if not page_token:
                 break
         
+        # Prime the name lookup cache (reversed so the first table with a given name wins)
+        for table in reversed(all_items):
+            self._table_id_cache[(doc_id, table.get('name'), include_views)] = table.get('id')
+        self._listed_docs.add((doc_id, include_views))
+        
         return {'items': all_items}
     
-    def find_table_by_name(self, table_name: str, doc_id: Optional[str] = None) -> Optional[str]:
-        """Find table ID by name"""
-        tables = self.list_tables(doc_id)
-        for table in tables.get("items", []):
-            if table.get("name") == table_name:
-                return table.get("id")
-        return None
+    def find_table_by_name(self, table_name: str, doc_id: Optional[str] = None, include_views: bool = False) -> Optional[str]:
+        """Find table ID by name (cached per document); only base tables are searched unless include_views"""
+        doc_id = doc_id or self.doc_id
+        if (doc_id, include_views) not in self._listed_docs:
+            self.list_tables(doc_id, include_views=include_views)
+        return self._table_id_cache.get((doc_id, table_name, include_views))
+    
+    def invalidate_table_cache(self, doc_id: Optional[str] = None):
+        """Forget cached table IDs and columns for one document, or for all documents if doc_id is None"""
+        if doc_id is None:
+            self._listed_docs.clear()
+        else:
+            self._listed_docs -= {(doc_id, True), (doc_id, False)}
+        for cache in (self._table_id_cache, self._columns_cache):
+            if doc_id is None:
+                cache.clear()
+                continue
+            for key in [k for k in cache if k[0] == doc_id]:
+                del cache[key]
+    
+    def list_columns(self, table_id: str, doc_id: Optional[str] = None) -> List[Dict]:
+        """List columns in a table (cached per document and table)"""
+        doc_id = doc_id or self.doc_id
+        if not doc_id:
+            raise ValueError("Document ID required")
+        
+        key = (doc_id, table_id)
+        if key not in self._columns_cache:
+            url = f"{self._table_url(table_id, doc_id)}/columns"
+            response = self._session.get(url)
+            response.raise_for_status()
+            self._columns_cache[key] = _loads(response.content).get('items', [])
+        return self._columns_cache[key]
+    
+    def mutation_completed(self, request_id: str) -> bool:
+        """Check whether an asynchronous write (identified by the requestId Coda returned) has been applied"""
+        # Coda's mutation status endpoint is not doc-scoped
+        url = f"{self.base_url}/mutationStatus/{request_id}"
+        response = self._session.get(url)
+        response.raise_for_status()
+        return bool(_loads(response.content).get('completed'))
     
     def list_rows(self, table_id: str, doc_id: Optional[str] = None) -> Dict:
         """List rows in a table"""
@@ -125,10 +353,47 @@ class CodaUpdater:
         if not doc_id:
             raise ValueError("Document ID required")
         
-        url = f"{self.base_url}/docs/{doc_id}/tables/{table_id}/rows"
-        response = requests.get(url, headers=self._get_headers())
+        url = f"{self._table_url(table_id, doc_id)}/rows"
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+    
+    def upsert_rows(self, table_id: str, rows: List[Dict], key_columns: list, doc_id: Optional[str] = None) -> List[Dict]:
+        """
+        Upsert multiple rows in a table, sending up to MAX_BATCH rows per request
+        
+        Args:
+            table_id: Table ID
+            rows: List of dictionaries of column_name: value pairs
+            key_columns: List of column names to use as keys for matching
+            doc_id: Document ID (optional)
+        
+        Returns:
+            List of API responses, one per batch
+        """
+        doc_id = doc_id or self.doc_id
+        if not doc_id:
+            raise ValueError("Document ID required")
+        
+        url = f"{self._table_url(table_id, doc_id)}/rows"
+        
+        responses = []
+        for batch in _chunked(rows, MAX_BATCH):
+            # Format row data for Coda API
+            payload = {
+                "rows": [
+                    {"cells": [{"column": col_name, "value": value} for col_name, value in row_data.items()]}
+                    for row_data in batch
+                ],
+                "keyColumns": key_columns
+            }
+            
+            # Pre-serialized body; the session already sends Content-Type: application/json
+            response = self._session.post(url, data=_dumps(payload))
+            response.raise_for_status()
+            responses.append(_loads(response.content))
+        
+        return responses
     
     def upsert_row(self, table_id: str, row_data: Dict, key_columns: list, doc_id: Optional[str] = None) -> Dict:
         """
@@ -140,30 +405,75 @@ class CodaUpdater:
             key_columns: List of column names to use as keys for matching
             doc_id: Document ID (optional)
         """
+        return self.upsert_rows(table_id, [row_data], key_columns, doc_id=doc_id)[0]
+    
+    def _upsert_each(self, table_id: str, rows: List[Dict], key_columns: list, doc_id: Optional[str] = None) -> Tuple[int, List[Tuple[Dict, Exception]]]:
+        """
+        Upsert rows one request per row, concurrently
+        
+        Returns:
+            Tuple of (number of rows upserted, list of (row_data, exception) for failures)
+        """
+        upserted = 0
+        failures = []
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {
+                executor.submit(self.upsert_row, table_id, row_data, key_columns, doc_id): row_data
+                for row_data in rows
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    upserted += 1
+                except requests.RequestException as e:
+                    failures.append((futures[future], e))
+        
+        return upserted, failures
+    
+    def upsert_rows_with_fallback(self, table_id: str, rows: List[Dict], key_columns: list, doc_id: Optional[str] = None) -> List[Tuple[Dict, Exception]]:
+        """
+        Upsert rows in batches of MAX_BATCH, retrying a failed batch one row at a time
+        
+        One bad row then only costs that row instead of the whole batch.
+        
+        Returns:
+            List of (row_data, exception) for rows that could not be upserted
+        """
+        failures = []
+        for batch in _chunked(rows, MAX_BATCH):
+            try:
+                self.upsert_rows(table_id, batch, key_columns, doc_id=doc_id)
+            except requests.RequestException:
+                failures.extend(self._upsert_each(table_id, batch, key_columns, doc_id=doc_id)[1])
+        return failures
+    
+    def insert_rows(self, table_id: str, rows: List[Dict], doc_id: Optional[str] = None) -> Dict:
+        """
+        Insert rows without key columns (every call adds new rows)
+        
+        Args:
+            table_id: Table ID
+            rows: List of dictionaries of column_name: value pairs
+            doc_id: Document ID (optional)
+        
+        Returns:
+            API response (includes addedRowIds); raises requests.HTTPError on failure
+        """
         doc_id = doc_id or self.doc_id
         if not doc_id:
             raise ValueError("Document ID required")
         
-        url = f"{self.base_url}/docs/{doc_id}/tables/{table_id}/rows"
-        
-        # Format row data for Coda API
-        cells = []
-        for col_name, value in row_data.items():
-            cells.append({
-                "column": col_name,
-                "value": value
-            })
-        
+        url = f"{self._table_url(table_id, doc_id)}/rows"
         payload = {
-            "rows": [{
-                "cells": cells
-            }],
-            "keyColumns": key_columns
+            "rows": [
+                {"cells": [{"column": col_name, "value": value} for col_name, value in row_data.items()]}
+                for row_data in rows
+            ]
         }
-        
-        response = requests.post(url, headers=self._get_headers(), json=payload)
+        response = self._session.post(url, data=_dumps(payload))
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_rows(self, table_id: str, row_ids: List[str], doc_id: Optional[str] = None) -> bool:
         """
@@ -184,20 +494,46 @@ class CodaUpdater:
         if not row_ids:
             return True
         
-        url = f"{self.base_url}/docs/{doc_id}/tables/{table_id}/rows"
+        try:
+            self.delete_rows_bulk(table_id, row_ids, doc_id)
+        except requests.RequestException as e:
+            logger.warning("Could not delete rows from table %s: %s", table_id, e)
+            return False
+        return True
+    
+    def delete_rows_bulk(self, table_id: str, row_ids: List[str], doc_id: Optional[str] = None) -> List[str]:
+        """
+        Delete rows with Coda's bulk delete endpoint (one request per MAX_BATCH rows)
         
-        # Delete rows one by one (Coda API limitation)
-        deleted_count = 0
-        for row_id in row_ids:
-            try:
-                delete_url = f"{url}/{row_id}"
-                response = requests.delete(delete_url, headers=self._get_headers())
-                if response.status_code in [200, 204]:
-                    deleted_count += 1
-            except:
-                pass
+        Returns:
+            requestIds of the deletions, which Coda applies asynchronously (see mutation_completed);
+            raises requests.HTTPError on failure
+        """
+        doc_id = doc_id or self.doc_id
+        if not doc_id:
+            raise ValueError("Document ID required")
         
-        return deleted_count == len(row_ids)
+        url = f"{self._table_url(table_id, doc_id)}/rows"
+        
+        request_ids = []
+        for batch in _chunked(row_ids, MAX_BATCH):
+            response = self._session.delete(url, data=_dumps({"rowIds": batch}))
+            response.raise_for_status()
+            request_ids.append(_loads(response.content).get('requestId'))
+        
+        return [r for r in request_ids if r]
+    
+    def _row_hash_path(self, doc_id: str, table_id: str) -> Path:
+        """Path of the row hash cache file for a table"""
+        return ROW_HASH_CACHE_DIR / f"{doc_id}_{table_id}.json"
+    
+    def _load_row_hashes(self, doc_id: str, table_id: str) -> Dict[str, str]:
+        """Load cached row hashes for a table (empty if missing or unreadable)"""
+        return read_json_cache(self._row_hash_path(doc_id, table_id))
+    
+    def _save_row_hashes(self, doc_id: str, table_id: str, row_hashes: Dict[str, str]):
+        """Persist row hashes for a table"""
+        write_json_cache(self._row_hash_path(doc_id, table_id), row_hashes)
     
     def update_partner_metrics(self, partner_name: str, metrics: Dict, table_name: str = "Partner Metrics", table_id: Optional[str] = None, doc_id: Optional[str] = None) -> Dict:
         """
@@ -237,7 +573,7 @@ class CodaUpdater:
             "Advanced Sales Training": metrics.get("advanced_sales_training", 0),
             "Advanced Technical Training": metrics.get("advanced_technical_training", 0),
             "General Access Training": metrics.get("general_access_training", 0),
-            "Last Updated": datetime.now().strftime("%m/%d/%Y")
+            "Last Updated": _last_updated_stamp()
         }
         
         # Add 14-day comparison if available
@@ -279,12 +615,12 @@ class CodaUpdater:
             "Platinum Status": status_data.get("platinum_status", "Not Qualified"),
             "Managed Revenue Gap": status_data.get("managed_revenue_gap", 0),
             "Referral Revenue Gap": status_data.get("referral_revenue_gap", 0),
-            "Last Updated": datetime.now().strftime("%m/%d/%Y")
+            "Last Updated": _last_updated_stamp()
         }
         
         return self.upsert_row(table_id, row_data, key_columns=["Partner"], doc_id=doc_id)
     
-    def update_accounts_table(self, partner_name: str, accounts: list, table_name: str = None, doc_id: Optional[str] = None) -> Dict:
+    def update_accounts_table(self, partner_name: str, accounts: list, table_name: str = None, doc_id: Optional[str] = None, skip_unchanged: bool = True) -> Dict:
         """
         Update accounts table in Coda with account metrics
         
@@ -293,6 +629,7 @@ class CodaUpdater:
             accounts: List of AccountSnapshot objects or dictionaries with account data
             table_name: Name of the Coda table (e.g., "Pyxis Accounts" or "{partner_name} Accounts")
             doc_id: Document ID (optional)
+            skip_unchanged: Skip accounts whose data (ignoring Last Updated) matches the last successful upsert
         
         Returns:
             Dictionary with update results
@@ -309,55 +646,55 @@ class CodaUpdater:
         if not table_id:
             raise ValueError(f"Table '{table_name}' not found in document. Available tables: {[t.get('name') for t in self.list_tables(doc_id).get('items', [])]}")
         
-        # Convert AccountSnapshot objects to dicts if needed
+        # Read fields straight off dicts or AccountSnapshot-like objects (no asdict copy)
+        last_updated = _last_updated_stamp()
         account_dicts = []
         for acc in accounts:
-            if hasattr(acc, '__dict__'):
-                # It's a dataclass/object - try asdict first, fallback to __dict__
-                try:
-                    acc_dict = asdict(acc)
-                except (TypeError, AttributeError):
-                    acc_dict = acc.__dict__
-            else:
-                acc_dict = acc
+            get = acc.get if isinstance(acc, dict) else partial(getattr, acc)
             
             # Format row data for Coda
             row_data = {
-                "Account ID": str(acc_dict.get("account_id", "")),
-                "Owner Email": acc_dict.get("owner_email", ""),
-                "Company Name": acc_dict.get("company_name", ""),
-                "Plan Name": acc_dict.get("plan_name", ""),
-                "Plan Family": acc_dict.get("plan_family", ""),
-                "Plan ARR (USD)": float(acc_dict.get("plan_arr", 0)),
-                "Upmarket Customer": acc_dict.get("upmarket_customer", "No"),
-                "Role Vertical": acc_dict.get("role_vertical", ""),
-                "Role Clean": acc_dict.get("role_clean", ""),
-                "Company Size": acc_dict.get("company_size", ""),
-                "Apps Used (28d)": int(acc_dict.get("apps_used_28d", 0)),
-                "Tasks Success Billable": int(acc_dict.get("tasks_success_billable", 0)),
-                "Last Updated": datetime.now().strftime("%m/%d/%Y"),
-                "Partner": partner_name  # For filtering/grouping
+                column: coerce(get(field, default)) if coerce else get(field, default)
+                for column, field, coerce, default in _ACCOUNT_FIELDS
             }
+            row_data["Last Updated"] = last_updated
+            row_data["Partner"] = partner_name  # For filtering/grouping
             account_dicts.append(row_data)
         
-        # Upsert all accounts (using Account ID as key)
+        # Skip accounts whose content hasn't changed since the last successful upsert
+        row_hashes = self._load_row_hashes(doc_id, table_id)
+        new_hashes = {}
+        pending = []
+        skipped_count = 0
+        for row_data in account_dicts:
+            account_id = row_data["Account ID"]
+            new_hashes[account_id] = _row_hash(row_data)
+            if skip_unchanged and row_hashes.get(account_id) == new_hashes[account_id]:
+                skipped_count += 1
+            else:
+                pending.append(row_data)
+        
+        # Upsert accounts in batches (using Account ID as key)
         updated_count = 0
         errors = []
         
-        for row_data in account_dicts:
-            try:
-                self.upsert_row(
-                    table_id=table_id,
-                    row_data=row_data,
-                    key_columns=["Account ID"],
-                    doc_id=doc_id
-                )
+        failures = self.upsert_rows_with_fallback(table_id, pending, ["Account ID"], doc_id=doc_id)
+        failed_ids = {row_data["Account ID"] for row_data, _ in failures}
+        for row_data, e in failures:
+            errors.append(f"Account {row_data.get('Account ID')}: {str(e)}")
+        
+        for row_data in pending:
+            account_id = row_data["Account ID"]
+            if account_id not in failed_ids:
+                row_hashes[account_id] = new_hashes[account_id]
                 updated_count += 1
-            except Exception as e:
-                errors.append(f"Account {row_data.get('Account ID')}: {str(e)}")
+        
+        if updated_count:
+            self._save_row_hashes(doc_id, table_id, row_hashes)
         
         return {
             "updated": updated_count,
+            "skipped": skipped_count,
             "total": len(account_dicts),
             "errors": errors
         }
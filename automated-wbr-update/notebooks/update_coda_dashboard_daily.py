@@ -16,28 +16,178 @@ Usage:
 
 import os
 import sys
+import time
+import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from notebooks.coda_updater import CodaUpdater, parse_coda_url
+from notebooks.coda_updater import (
+    CodaUpdater, MAX_CONCURRENT_REQUESTS, content_hash, parse_coda_url, read_json_cache, write_json_cache
+)
 from notebooks.upmarket_funnel import UpmarketFunnelGenerator, get_current_quarter_target
 
+# Content hash of the rows each table was last pushed successfully with, per doc
+SECTION_HASH_PATH = Path.home() / ".cache" / "coda_dashboard_hashes.json"
+
+
+def _retry_after_seconds(response: requests.Response, default: float = 1.0) -> float:
+    """Seconds to wait according to a 429 response's Retry-After header"""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _column_rejected(error: requests.HTTPError) -> bool:
+    """True if Coda rejected the request itself (e.g. unknown column), so another column may work"""
+    return error.response is not None and error.response.status_code in (400, 404)
+
+
+@dataclass(frozen=True)
+class SummaryInputs:
+    """Values the executive summary text is rendered from"""
+    total_managed: float
+    total_referral: float
+    pyxis_current: float
+    xray_current: float
+    pyxis_leads: int
+    xray_leads: int
+    activation_leads: int
+    needing_activation: Tuple[str, ...]
+    total_leads: int
+    enterprise_leads: int
+    estimated_revenue: float
+    current_quarter_target: float
+    next_steps_text: str
+
+
+@lru_cache(maxsize=16)
+def _format_summary(inputs: SummaryInputs) -> str:
+    """Render the executive summary text (cached, since reruns usually see the same inputs)"""
+    needing_activation = inputs.needing_activation
+    return f"""**2 of 4 partners exceeding revenue targets (${inputs.total_managed:,.0f} managed, ${inputs.total_referral:,.0f} referral). Pyxis ${inputs.pyxis_current:,.0f} ({inputs.pyxis_leads} leads) | Xray.Tech ${inputs.xray_current:,.0f} ({inputs.xray_leads} leads). {', '.join(needing_activation)} need{'s' if len(needing_activation) == 1 else ''} activation (${0:,.0f} revenue, {inputs.activation_leads} leads). Upmarket funnel: {inputs.total_leads} leads ({inputs.enterprise_leads} Enterprise) → ${inputs.estimated_revenue:,.0f} est. revenue / ${inputs.current_quarter_target:,.0f} target.{inputs.next_steps_text}**"""
+
 
 class CodaDashboardUpdater:
     """Updates the Coda dashboard with latest data"""
     
-    def __init__(self, api_token: str, doc_id: str):
+    def __init__(self, api_token: str, doc_id: str, force: bool = False):
         self.updater = CodaUpdater(api_token=api_token, doc_id=doc_id)
         self.doc_id = doc_id
+        # Push every section even if its rows are unchanged since the last run
+        self.force = force
+        self._all_section_hashes = read_json_cache(SECTION_HASH_PATH)
+        self._last_hashes: Dict[str, str] = self._all_section_hashes.setdefault(doc_id, {})
+    
+    def _first_column(self, table_id: str, default_name: str) -> Tuple[Optional[str], str]:
+        """
+        ID and name of a table's first column (the column list is cached by the updater)
+        
+        Falls back to (None, default_name) if the columns can't be listed.
+        """
+        try:
+            columns = self.updater.list_columns(table_id, self.doc_id)
+        except requests.RequestException:
+            return None, default_name
+        if not columns:
+            return None, default_name
+        
+        # Use ID (more reliable than name) and keep the name as a fallback
+        return columns[0].get('id'), columns[0].get('name')
+    
+    def _is_unchanged(self, table_name: str, payload) -> bool:
+        """True (and reports the skip) if payload matches what was last pushed to the table"""
+        if self.force or self._last_hashes.get(table_name) != content_hash(payload):
+            return False
+        print(f"  ⏭ {table_name}: unchanged since last run, skipping")
+        return True
+    
+    def _record_push(self, table_name: str, payload):
+        """Remember payload as the table's last successful push"""
+        self._last_hashes[table_name] = content_hash(payload)
+    
+    def _bulk_upsert(self, table_name: str, table_id: str, rows: List[Dict], key_columns: List[str]) -> bool:
+        """Upsert all rows in a single batched request, reporting any rows that fail
+        
+        Returns:
+            True if every row was written (the rows are then recorded as the table's last push)
+        """
+        failures = self.updater.upsert_rows_with_fallback(table_id, rows, key_columns, self.doc_id)
+        for row, e in failures:
+            label = " - ".join(str(row.get(column)) for column in key_columns)
+            print(f"  ⚠ Error updating {label}: {e}")
+        if failures:
+            return False
+        self._record_push(table_name, rows)
+        return True
+    
+    def _wait_until(self, predicate, max_wait: float = 15.0, initial: float = 0.2) -> bool:
+        """Poll predicate with exponential backoff (capped at 2s) until it is true or max_wait elapses"""
+        deadline = time.monotonic() + max_wait
+        delay = initial
+        while True:
+            if predicate():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 2.0)
+    
+    def _wait_for_mutations(self, request_ids: List[str], max_wait: float = 15.0) -> bool:
+        """Wait until Coda reports every asynchronous write in request_ids as completed"""
+        pending = set(request_ids)
+        
+        def all_completed():
+            for request_id in list(pending):
+                if self.updater.mutation_completed(request_id):
+                    pending.discard(request_id)
+            return not pending
+        
+        return self._wait_until(all_completed, max_wait)
+    
+    def _insert_cell(self, table_id: str, column: str, value) -> Dict:
+        """
+        Insert a single-cell row, raising requests.HTTPError on failure
+        
+        The session already backs off on 429; if Coda is still rate limiting after that,
+        wait for Retry-After and try once more rather than moving on to other fallbacks.
+        
+        Returns:
+            API response (includes addedRowIds)
+        """
+        rows = [{column: value}]
+        try:
+            return self.updater.insert_rows(table_id, rows, self.doc_id)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 429:
+                raise
+            time.sleep(_retry_after_seconds(e.response))
+        return self.updater.insert_rows(table_id, rows, self.doc_id)
+    
+    def _delete_rows(self, table_id: str, row_ids: List[str]):
+        """
+        Delete rows in a single bulk request
+        
+        Returns:
+            Tuple of (number of rows deleted, requestIds of the asynchronous deletions)
+        """
+        try:
+            request_ids = self.updater.delete_rows_bulk(table_id, row_ids, self.doc_id)
+        except requests.RequestException as e:
+            print(f"    ⚠ Could not delete existing rows: {e}")
+            return 0, []
+        return len(row_ids), request_ids
     
     def update_last_updated_timestamp(self):
         """Update the last updated timestamp at the top of the page"""
-        import requests
-        from datetime import datetime
-        
         table_name = "Last Updated"
         table_id = self.updater.find_table_by_name(table_name, self.doc_id)
         
@@ -46,21 +196,8 @@ class CodaDashboardUpdater:
             print(f"     Create a table named '{table_name}' with a 'Date' column to enable auto-updates.")
             return False
         
-        # Get the column name from the table structure
-        try:
-            url = f"{self.updater.base_url}/docs/{self.doc_id}/tables/{table_id}/columns"
-            response = requests.get(url, headers=self.updater._get_headers())
-            if response.status_code == 200:
-                columns = response.json().get('items', [])
-                if columns:
-                    column_id = columns[0].get('id')
-                    column_name = columns[0].get('name')
-                else:
-                    column_name = "Date"
-            else:
-                column_name = "Date"
-        except:
-            column_name = "Date"
+        # Get the column from the table structure
+        column_id, column_name = self._first_column(table_id, "Date")
         
         # Format timestamp
         now = datetime.now()
@@ -70,60 +207,39 @@ class CodaDashboardUpdater:
         try:
             rows = self.updater.list_rows(table_id, self.doc_id)
             existing_rows = rows.get('items', [])
-        except:
+        except requests.RequestException:
             existing_rows = []
         
-        url = f"{self.updater.base_url}/docs/{self.doc_id}/tables/{table_id}/rows"
-        
         # Delete all existing rows first
         if existing_rows:
             all_row_ids = [row.get('id') for row in existing_rows]
-            for row_id in all_row_ids:
-                try:
-                    delete_url = f"{url}/{row_id}"
-                    delete_response = requests.delete(delete_url, headers=self.updater._get_headers())
-                except:
-                    pass
+            _, request_ids = self._delete_rows(table_id, all_row_ids)
             
-            import time
-            time.sleep(2)
+            # Deletions are applied asynchronously; wait for them before inserting
+            try:
+                self._wait_for_mutations(request_ids)
+            except requests.RequestException:
+                pass
         
         # Insert one new row with timestamp
+        column_identifier = column_id if column_id else column_name
         try:
-            payload = {
-                "rows": [{
-                    "cells": [{
-                        "column": column_id if 'column_id' in locals() else column_name,
-                        "value": timestamp_text
-                    }]
-                }]
-            }
-            
-            response = requests.post(url, headers=self.updater._get_headers(), json=payload)
-            if response.status_code in [200, 202]:
-                import time
-                time.sleep(2)
-                print(f"  ✅ Updated '{table_name}' timestamp: {timestamp_text}")
-                return True
-        except Exception as e:
-            # Try with column name
-            try:
-                payload = {
-                    "rows": [{
-                        "cells": [{
-                            "column": column_name,
-                            "value": timestamp_text
-                        }]
-                    }]
-                }
-                response = requests.post(url, headers=self.updater._get_headers(), json=payload)
-                if response.status_code in [200, 202]:
-                    import time
-                    time.sleep(2)
+            self._insert_cell(table_id, column_identifier, timestamp_text)
+            print(f"  ✅ Updated '{table_name}' timestamp: {timestamp_text}")
+            return True
+        except requests.HTTPError as e:
+            # Try with column name, but only if the column ID itself was rejected
+            if _column_rejected(e) and column_name != column_identifier:
+                try:
+                    self._insert_cell(table_id, column_name, timestamp_text)
                     print(f"  ✅ Updated '{table_name}' timestamp: {timestamp_text}")
                     return True
-            except:
-                pass
+                except requests.RequestException as e:
+                    print(f"    ⚠ {e}")
+            else:
+                print(f"    ⚠ {e}")
+        except requests.RequestException as e:
+            print(f"    ⚠ {e}")
         
         print(f"  ⚠ Could not update '{table_name}' timestamp")
         return False
@@ -140,13 +256,12 @@ class CodaDashboardUpdater:
         
         # Update funnel stages
         stages = funnel_data.get('funnel_stages', [])
-        for stage_row in stages:
-            try:
-                self.updater.upsert_row(table_id, stage_row, ["Stage"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating stage {stage_row.get('Stage')}: {e}")
+        if self._is_unchanged(table_name, stages):
+            return True
+        written = self._bulk_upsert(table_name, table_id, stages, ["Stage"])
         
         print(f"  ✅ Updated {table_name} with {len(stages)} stages")
+        return written
     
     def update_funnel_summary(self, funnel_data: Dict):
         """Update Funnel Summary KPIs (replaces old Executive Summary KPIs)"""
@@ -206,13 +321,12 @@ class CodaDashboardUpdater:
             }
         ]
         
-        for row in rows:
-            try:
-                self.updater.upsert_row(table_id, row, ["Metric"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating {row.get('Metric')}: {e}")
+        if self._is_unchanged(table_name, rows):
+            return True
+        written = self._bulk_upsert(table_name, table_id, rows, ["Metric"])
         
         print(f"  ✅ Updated {table_name}")
+        return written
     
     def update_managed_revenue(self, partner_data: List[Dict]):
         """Update All Partners Managed Revenue table"""
@@ -223,13 +337,12 @@ class CodaDashboardUpdater:
             print(f"⚠ Table '{table_name}' not found")
             return
         
-        for row in partner_data:
-            try:
-                self.updater.upsert_row(table_id, row, ["Partner"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating {row.get('Partner')}: {e}")
+        if self._is_unchanged(table_name, partner_data):
+            return True
+        written = self._bulk_upsert(table_name, table_id, partner_data, ["Partner"])
         
         print(f"  ✅ Updated {table_name} with {len(partner_data)} partners")
+        return written
     
     def update_referral_revenue(self, partner_data: List[Dict]):
         """Update All Partners Referral Revenue table"""
@@ -240,13 +353,12 @@ class CodaDashboardUpdater:
             print(f"⚠ Table '{table_name}' not found")
             return
         
-        for row in partner_data:
-            try:
-                self.updater.upsert_row(table_id, row, ["Partner"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating {row.get('Partner')}: {e}")
+        if self._is_unchanged(table_name, partner_data):
+            return True
+        written = self._bulk_upsert(table_name, table_id, partner_data, ["Partner"])
         
         print(f"  ✅ Updated {table_name} with {len(partner_data)} partners")
+        return written
     
     def update_training(self, partner_data: List[Dict]):
         """Update All Partners Training table"""
@@ -257,13 +369,12 @@ class CodaDashboardUpdater:
             print(f"⚠ Table '{table_name}' not found")
             return
         
-        for row in partner_data:
-            try:
-                self.updater.upsert_row(table_id, row, ["Partner"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating {row.get('Partner')}: {e}")
+        if self._is_unchanged(table_name, partner_data):
+            return True
+        written = self._bulk_upsert(table_name, table_id, partner_data, ["Partner"])
         
         print(f"  ✅ Updated {table_name} with {len(partner_data)} partners")
+        return written
     
     def update_partner_summaries(self, summaries: List[Dict]):
         """Update Partner Performance Summaries table"""
@@ -274,33 +385,44 @@ class CodaDashboardUpdater:
             print(f"⚠ Table '{table_name}' not found")
             return
         
-        for row in summaries:
-            try:
-                self.updater.upsert_row(table_id, row, ["Partner", "Section"], self.doc_id)
-            except Exception as e:
-                print(f"  ⚠ Error updating {row.get('Partner')} - {row.get('Section')}: {e}")
+        if self._is_unchanged(table_name, summaries):
+            return True
+        written = self._bulk_upsert(table_name, table_id, summaries, ["Partner", "Section"])
         
         print(f"  ✅ Updated {table_name} with {len(summaries)} entries")
+        return written
     
     def generate_executive_summary_text(self, data: Dict) -> str:
         """Generate ultra-concise executive summary - scannable in seconds"""
-        # Count partners exceeding targets
-        exceeding_partners = [p for p in data.get('managed_revenue', []) if p.get('Status') == 'Exceeded']
-        needing_activation = [p for p in data.get('managed_revenue', []) if p.get('Status') == 'Not Started']
+        # Count partners exceeding targets / needing activation, total managed revenue and
+        # index rows by partner in one pass
+        managed = data.get('managed_revenue', [])
+        by_partner = {}
+        exceeding_partners = []
+        needing_activation = []
+        total_managed = 0
+        for p in managed:
+            # Keep the first row per partner, as the previous linear scans did
+            by_partner.setdefault(p.get('Partner'), p)
+            total_managed += p.get('Current', 0)
+            status = p.get('Status')
+            if status == 'Exceeded':
+                exceeding_partners.append(p)
+            elif status == 'Not Started':
+                needing_activation.append(p)
         
-        # Get totals
-        total_managed = sum(p.get('Current', 0) for p in data.get('managed_revenue', []))
         total_referral = sum(p.get('Current', 0) for p in data.get('referral_revenue', []))
         
         # Get specific partner data
-        pyxis_mgmt = next((p for p in data.get('managed_revenue', []) if p.get('Partner') == 'Pyxis'), {})
-        xray_mgmt = next((p for p in data.get('managed_revenue', []) if p.get('Partner') == 'Xray.Tech'), {})
+        pyxis_mgmt = by_partner.get('Pyxis', {})
+        xray_mgmt = by_partner.get('Xray.Tech', {})
         
         # Get upmarket lead counts (default to 0 if not provided)
-        pyxis_leads = data.get('upmarket_leads', {}).get('Pyxis', 0)
-        xray_leads = data.get('upmarket_leads', {}).get('Xray.Tech', 0)
-        izeno_leads = data.get('upmarket_leads', {}).get('iZeno', 0)
-        orium_leads = data.get('upmarket_leads', {}).get('Orium', 0)
+        upmarket_leads = data.get('upmarket_leads', {})
+        pyxis_leads = upmarket_leads.get('Pyxis', 0)
+        xray_leads = upmarket_leads.get('Xray.Tech', 0)
+        izeno_leads = upmarket_leads.get('iZeno', 0)
+        orium_leads = upmarket_leads.get('Orium', 0)
         
         # Get next steps with due dates
         next_steps = data.get('next_steps', [])
@@ -326,17 +448,27 @@ class CodaDashboardUpdater:
         estimated_revenue = funnel_summary.get('Estimated Revenue', 0)
         
         # Build ultra-concise summary with funnel data
-        summary = f"""**2 of 4 partners exceeding revenue targets (${total_managed:,.0f} managed, ${total_referral:,.0f} referral). Pyxis ${pyxis_mgmt.get('Current', 0):,.0f} ({pyxis_leads} leads) | Xray.Tech ${xray_mgmt.get('Current', 0):,.0f} ({xray_leads} leads). {', '.join([p.get('Partner') for p in needing_activation])} need{'s' if len(needing_activation) == 1 else ''} activation (${0:,.0f} revenue, {izeno_leads + orium_leads} leads). Upmarket funnel: {total_leads} leads ({enterprise_leads} Enterprise) → ${estimated_revenue:,.0f} est. revenue / ${current_quarter_target:,.0f} target.{next_steps_text}**"""
-        
-        return summary
+        return _format_summary(SummaryInputs(
+            total_managed=total_managed,
+            total_referral=total_referral,
+            pyxis_current=pyxis_mgmt.get('Current', 0),
+            xray_current=xray_mgmt.get('Current', 0),
+            pyxis_leads=pyxis_leads,
+            xray_leads=xray_leads,
+            activation_leads=izeno_leads + orium_leads,
+            needing_activation=tuple(p.get('Partner') for p in needing_activation),
+            total_leads=total_leads,
+            enterprise_leads=enterprise_leads,
+            estimated_revenue=estimated_revenue,
+            current_quarter_target=current_quarter_target,
+            next_steps_text=next_steps_text
+        ))
     
     def update_executive_summary_text(self, summary_text: str):
         """Update the executive summary text in a table (for display in text box)
         
         Deletes all existing rows and inserts one new row to prevent duplicates.
         """
-        import requests
-        
         # Try both possible table names
         table_name = "Executive Summary"
         table_id = self.updater.find_table_by_name(table_name, self.doc_id)
@@ -351,77 +483,43 @@ class CodaDashboardUpdater:
             print(f"     Create a table named 'Executive Summary' with a text column to enable auto-updates.")
             return False
         
+        if self._is_unchanged(table_name, summary_text):
+            return True
+        
         # Get the column ID from the table structure (more reliable than name)
-        try:
-            url = f"{self.updater.base_url}/docs/{self.doc_id}/tables/{table_id}/columns"
-            response = requests.get(url, headers=self.updater._get_headers())
-            if response.status_code == 200:
-                columns = response.json().get('items', [])
-                if columns:
-                    column_id = columns[0].get('id')  # Use ID instead of name
-                    column_name = columns[0].get('name')  # Keep name as fallback
-                else:
-                    column_id = None
-                    column_name = "Summary Text"
-            else:
-                column_id = None
-                column_name = "Summary Text"
-        except:
-            column_id = None
-            column_name = "Summary Text"
+        column_id, column_name = self._first_column(table_id, "Summary Text")
         
         # Get existing rows
         try:
             rows = self.updater.list_rows(table_id, self.doc_id)
             existing_rows = rows.get('items', [])
-        except:
+        except requests.RequestException:
             existing_rows = []
         
-        url = f"{self.updater.base_url}/docs/{self.doc_id}/tables/{table_id}/rows"
-        
         # Strategy: Delete ALL rows first, then insert one new row
         # This ensures we never have duplicates
         # Coda API is async, so we need to wait for deletions to complete
+        # Only a replace whose deletions were confirmed is recorded as this table's last push,
+        # so a run that may have left duplicates behind is repeated (and cleaned up) next time
+        deletions_done = True
         if existing_rows:
             # Delete ALL existing rows
             all_row_ids = [row.get('id') for row in existing_rows]
-            deleted_count = 0
-            
-            for row_id in all_row_ids:
-                try:
-                    delete_url = f"{url}/{row_id}"
-                    delete_response = requests.delete(delete_url, headers=self.updater._get_headers())
-                    # Coda returns 202 (Accepted) for async operations - this is OK
-                    if delete_response.status_code in [200, 202, 204]:
-                        deleted_count += 1
-                except Exception as e:
-                    print(f"    ⚠ Could not delete row {row_id}: {e}")
+            deleted_count, request_ids = self._delete_rows(table_id, all_row_ids)
             
             if deleted_count > 0:
                 print(f"    ✓ Deleted {deleted_count} existing row(s)")
             
-            # Wait for async deletions to complete (Coda API is async)
-            import time
-            time.sleep(3)  # Initial wait
-            
-            # Verify deletions completed by checking row count
-            max_retries = 10
-            for retry in range(max_retries):
-                try:
-                    check_rows = self.updater.list_rows(table_id, self.doc_id)
-                    remaining = len(check_rows.get('items', []))
-                    if remaining == 0:
-                        print(f"    ✓ All rows deleted (verified after {retry + 1} checks)")
-                        break
-                    if retry < max_retries - 1:
-                        time.sleep(2)  # Wait 2 seconds between checks
-                except:
-                    break
-            
-            # Final check - if rows still exist, warn but continue
-            final_check = self.updater.list_rows(table_id, self.doc_id)
-            if len(final_check.get('items', [])) > 0:
-                print(f"    ⚠ Warning: {len(final_check.get('items', []))} rows still exist (deletions may be delayed)")
+            # Wait for async deletions to complete (Coda API is async), polling the
+            # mutation status of each delete rather than re-listing the table
+            try:
+                deletions_done = deleted_count == len(all_row_ids) and self._wait_for_mutations(request_ids)
+            except requests.RequestException:
+                deletions_done = False
+            if deletions_done:
+                print(f"    ✓ All deletions completed")
+            else:
+                print(f"    ⚠ Warning: some deletions are still processing (deletions may be delayed)")
                 print(f"       Will insert new row anyway - duplicates will be cleaned up on next run")
         
         # Now insert one new row (whether we deleted rows or not)
@@ -429,66 +527,65 @@ class CodaDashboardUpdater:
         column_identifier = column_id if column_id else column_name
         
         try:
-            payload = {
-                "rows": [{
-                    "cells": [{
-                        "column": column_identifier,
-                        "value": summary_text
-                    }]
-                }]
-            }
-            
-            response = requests.post(url, headers=self.updater._get_headers(), json=payload)
             # Coda returns 202 (Accepted) for async operations - this is success
-            if response.status_code in [200, 202]:
-                # Wait for async operation to complete (Coda needs time)
-                import time
-                time.sleep(5)  # Initial wait for insertion to process
-                
-                # Verify insertion completed
-                max_retries = 8
-                for retry in range(max_retries):
-                    check_rows = self.updater.list_rows(table_id, self.doc_id)
-                    final_count = len(check_rows.get('items', []))
-                    if final_count >= 1:  # At least one row exists
-                        if final_count == 1:
-                            print(f"  ✅ Updated '{table_name}' table (deleted old rows, inserted 1 new row)")
-                        else:
-                            print(f"  ✅ Updated '{table_name}' table (inserted new row, {final_count} total)")
-                            print(f"     Note: Some old rows may still be deleting (async). Run again to clean up.")
-                        return True
-                    if retry < max_retries - 1:
-                        time.sleep(2)  # Wait 2 seconds between checks
-                
-                # If we get here, insertion may have failed or is still processing
-                print(f"  ⚠ Insertion accepted but not yet visible (Coda async processing)")
-                print(f"     Check Coda in a few seconds - the row should appear")
-                return True  # Still return True as insertion was accepted
-            else:
-                response.raise_for_status()
-                
-        except Exception as e:
-            # Try alternative column names/IDs
+            result = self._insert_cell(table_id, column_identifier, summary_text)
+            
+            # The response lists the IDs of the rows it added; that confirms the insert
+            # without re-listing the table
+            added_row_ids = result.get('addedRowIds')
+            if added_row_ids:
+                print(f"  ✅ Updated '{table_name}' table (deleted old rows, inserted {len(added_row_ids)} new row)")
+                if deletions_done:
+                    self._record_push(table_name, summary_text)
+                return True
+            
+            # Otherwise wait (with backoff) for the async insertion to become visible
+            visible_rows = []
+            
+            def row_visible():
+                visible_rows[:] = self.updater.list_rows(table_id, self.doc_id).get('items', [])
+                return len(visible_rows) >= 1
+            
+            if self._wait_until(row_visible):
+                final_count = len(visible_rows)
+                if final_count == 1:
+                    print(f"  ✅ Updated '{table_name}' table (deleted old rows, inserted 1 new row)")
+                    self._record_push(table_name, summary_text)
+                else:
+                    print(f"  ✅ Updated '{table_name}' table (inserted new row, {final_count} total)")
+                    print(f"     Note: Some old rows may still be deleting (async). Run again to clean up.")
+                return True
+            
+            # If we get here, insertion may have failed or is still processing
+            print(f"  ⚠ Insertion accepted but not yet visible (Coda async processing)")
+            print(f"     Check Coda in a few seconds - the row should appear")
+            return True  # Still return True as insertion was accepted
+        
+        except requests.HTTPError as e:
+            if not _column_rejected(e):
+                # Rate limiting or a server error: more fallback posts would only add load
+                print(f"  ⚠ Error updating executive summary text: {e}")
+                return False
+            
+            # The column was rejected - try alternative column names/IDs
             for col_identifier in [column_id, column_name, "Summary Text", "Text", "Content", "Summary", "Name"]:
-                if col_identifier is None:
+                if col_identifier is None or col_identifier == column_identifier:
                     continue
                 try:
-                    payload = {
-                        "rows": [{
-                            "cells": [{
-                                "column": col_identifier,
-                                "value": summary_text
-                            }]
-                        }]
-                    }
-                    response = requests.post(url, headers=self.updater._get_headers(), json=payload)
-                    if response.status_code in [200, 202]:
-                        import time
-                        time.sleep(2)
-                        print(f"  ✅ Updated '{table_name}' table")
-                        return True
-                except:
-                    continue
+                    self._insert_cell(table_id, col_identifier, summary_text)
+                    print(f"  ✅ Updated '{table_name}' table")
+                    if deletions_done:
+                        self._record_push(table_name, summary_text)
+                    return True
+                except requests.HTTPError as e:
+                    if not _column_rejected(e):
+                        break
+                except requests.RequestException:
+                    break
+        
+        except requests.RequestException as e:
+            print(f"  ⚠ Error updating executive summary text: {e}")
+            return False
         
         print(f"  ⚠ Error updating executive summary text")
         return False
@@ -508,36 +605,54 @@ class CodaDashboardUpdater:
         print("🚀 Updating Coda Dashboard...")
         print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
-        # Update last updated timestamp at the top of the page
-        print("🕐 Updating Last Updated Timestamp...")
-        self.update_last_updated_timestamp()
+        # Fetch the table directory once; every table lookup below is then a cache hit
+        self.updater.list_tables(self.doc_id, include_views=False)
         
-        # Generate and update executive summary text (includes funnel data)
-        print("\n📝 Generating Executive Summary...")
+        # Generate executive summary text (includes funnel data)
+        print("📝 Generating Executive Summary...")
         summary_text = self.generate_executive_summary_text(data)
-        self.update_executive_summary_text(summary_text)
         
-        # Update upmarket sales funnel (replaces old Executive Summary KPIs)
+        # Each section writes its own table, so they can run side by side on the shared session
+        sections = [("📝 Executive Summary", self.update_executive_summary_text, summary_text)]
         if "funnel_data" in data:
-            print("\n📊 Updating Upmarket Sales Funnel...")
-            self.update_upmarket_funnel(data["funnel_data"])
-            self.update_funnel_summary(data["funnel_data"])
-        
+            # Upmarket sales funnel (replaces old Executive Summary KPIs)
+            sections.append(("📊 Upmarket Sales Funnel", self.update_upmarket_funnel, data["funnel_data"]))
+            sections.append(("📊 Funnel Summary", self.update_funnel_summary, data["funnel_data"]))
         if "managed_revenue" in data:
-            print("\n💰 Updating Managed Revenue...")
-            self.update_managed_revenue(data["managed_revenue"])
-        
+            sections.append(("💰 Managed Revenue", self.update_managed_revenue, data["managed_revenue"]))
         if "referral_revenue" in data:
-            print("\n💵 Updating Referral Revenue...")
-            self.update_referral_revenue(data["referral_revenue"])
-        
+            sections.append(("💵 Referral Revenue", self.update_referral_revenue, data["referral_revenue"]))
         if "training" in data:
-            print("\n🎓 Updating Training...")
-            self.update_training(data["training"])
-        
+            sections.append(("🎓 Training", self.update_training, data["training"]))
         if "partner_summaries" in data:
-            print("\n📝 Updating Partner Summaries...")
-            self.update_partner_summaries(data["partner_summaries"])
+            sections.append(("📝 Partner Summaries", self.update_partner_summaries, data["partner_summaries"]))
+        
+        # Skip sections with no data; each update_* skips its table itself if the rows it
+        # would send match the last successful push
+        pending = []
+        for label, update, arg in sections:
+            if not arg:
+                print(f"  ⏭ {label}: no data, skipping")
+                continue
+            pending.append((label, update, arg))
+        
+        print(f"\n🔄 Updating {len(pending)} sections concurrently...")
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                futures = {executor.submit(update, arg): label for label, update, arg in pending}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        # Surface the failure the same way the sequential run did
+                        print(f"  ❌ {futures[future]} update failed")
+                        raise
+        finally:
+            write_json_cache(SECTION_HASH_PATH, self._all_section_hashes)
+        
+        # Update the timestamp last so it reflects when every section finished
+        print("\n🕐 Updating Last Updated Timestamp...")
+        self.update_last_updated_timestamp()
         
         print("\n✅ Dashboard update complete!")
 
@@ -572,17 +687,18 @@ def get_latest_data():
     
     # Generate funnel
     funnel_data = funnel_generator.generate_funnel(leads_by_partner, current_quarter_target)
+    leads_per_partner = Counter(funnel_data['categorized_leads'].partners)
     
     # Example data structure - replace with actual data fetching
     return {
         "funnel_data": funnel_data,  # Upmarket sales funnel
         "funnel_summary": funnel_data.get('summary', {}),  # For executive summary
         "upmarket_leads": {
-            # Count leads by partner (will be populated from funnel_data)
-            "Pyxis": len([l for l in funnel_data.get('categorized_leads', []) if l.partner == 'Pyxis']),
-            "Xray.Tech": len([l for l in funnel_data.get('categorized_leads', []) if l.partner == 'Xray.Tech']),
-            "iZeno": len([l for l in funnel_data.get('categorized_leads', []) if l.partner == 'iZeno']),
-            "Orium": len([l for l in funnel_data.get('categorized_leads', []) if l.partner == 'Orium'])
+            # Number of upmarket leads submitted by each partner (counted from funnel_data)
+            "Pyxis": leads_per_partner['Pyxis'],
+            "Xray.Tech": leads_per_partner['Xray.Tech'],
+            "iZeno": leads_per_partner['iZeno'],
+            "Orium": leads_per_partner['Orium']
         },
         "managed_revenue": [
             {"Partner": "Pyxis", "Current": 11285.02, "Target": 10000, "Gap": 1285.02, "Status": "Exceeded", "14-Day Change": "+$530.61 (+4.9%)"},
@@ -602,13 +718,6 @@ def get_latest_data():
             {"Partner": "iZeno", "General Access": "1/1 ✅", "Advanced Sales": "0/4 ❌", "Advanced Technical": "0/4 ❌", "Overall Status": "In Progress"},
             {"Partner": "Orium", "General Access": "1/1 ✅", "Advanced Sales": "0/4 ❌", "Advanced Technical": "0/4 ❌", "Overall Status": "In Progress"}
         ],
-        "upmarket_leads": {
-            # Number of upmarket leads submitted by each partner
-            "Pyxis": 0,  # Replace with actual count
-            "Xray.Tech": 0,  # Replace with actual count
-            "iZeno": 0,  # Replace with actual count
-            "Orium": 0  # Replace with actual count
-        },
         "next_steps": [
             # Next steps with due dates (limit to 2 most important)
             # {"action": "Pyxis: Pick top 3 accounts", "due_date": "Jan 6, 2026"},
@@ -628,6 +737,7 @@ def main():
     parser.add_argument("--coda-token", type=str, help="Coda API token")
     parser.add_argument("--coda-doc-id", type=str, help="Coda document ID")
     parser.add_argument("--coda-doc-url", type=str, help="Coda document URL")
+    parser.add_argument("--force", action="store_true", help="Push every section, even if unchanged since the last run")
     
     args = parser.parse_args()
     
@@ -652,7 +762,7 @@ def main():
     data = get_latest_data()
     
     # Update dashboard
-    updater = CodaDashboardUpdater(api_token, doc_id)
+    updater = CodaDashboardUpdater(api_token, doc_id, force=args.force)
     updater.update_all(data)
 
 
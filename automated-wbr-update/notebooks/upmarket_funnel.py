@@ -5,28 +5,164 @@ Categorizes partner-submitted leads by Enterprise/Midmarket/SMB
 and calculates funnel metrics with estimated ACV and conversion rates.
 """
 
-from typing import Dict, List, Optional
+import sys
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, repeat
+
+
+# Segment names indexed by segment code (codes rank segments from smallest to largest)
+SEGMENT_NAMES = tuple(map(sys.intern, ('SMB', 'Midmarket', 'Enterprise')))
+SMB, MIDMARKET, ENTERPRISE = range(len(SEGMENT_NAMES))
+
+# Funnel stage names, in order (Leads plus one stage per CONVERSION_RATES entry)
+FUNNEL_STAGES = ('Leads', 'Qualified', 'Opportunities', 'Closed Won')
+
+# Pre-bound formatters for the funnel table's conversion rate and revenue cells
+_fmt_pct = "{:.1%}".format
+_fmt_usd = "${:,.0f}".format
+
+
+def _by_segment(values: Dict[str, float]) -> Tuple[float, ...]:
+    """Per-segment values keyed by segment name, as a tuple indexed by segment code"""
+    return tuple(values[name] for name in SEGMENT_NAMES)
+
+
+def _conversion_matrix(conversion_rates: Dict[str, Dict[str, float]]) -> Tuple[Tuple[float, ...], ...]:
+    """Conversion rates as one row per stage (in stage order), indexed by segment code"""
+    return tuple(_by_segment(rates) for rates in conversion_rates.values())
+
+
+def _typed_array(typecode: str, values: List, cast: Callable) -> array:
+    """
+    Typed array of values, casting element by element only when needed
+    
+    Lead scoring already emits numbers of the right type, so the array is normally built
+    straight from the list; values it rejects (floats for an int column, numeric strings)
+    fall back to casting each one, matching the old per-lead float()/int() calls.
+    """
+    try:
+        return array(typecode, values)
+    except TypeError:
+        return array(typecode, map(cast, values))
+
+
+# Lead fields the segment classifier takes, in argument order
+_NUMERIC_FIELDS = ('current_mrr', 'user_count', 'referral_arr', 'lead_score')
+
+
+def _lead_columns(leads: List[Union['Lead', Dict]], fields: Sequence[str]) -> List[Sequence]:
+    """
+    Raw columns of the given Lead fields across a batch of leads
+    
+    A batch of Lead tuples is transposed in one zip(). Lead-scoring dicts are read field by
+    field, with missing fields taking the Lead defaults; a batch mixing both is read as dicts.
+    """
+    if leads and all(type(lead) is Lead for lead in leads):
+        columns = dict(zip(Lead._fields, zip(*leads)))
+        return [columns[field] for field in fields]
+    
+    defaults = Lead._field_defaults
+    try:
+        return [[lead.get(field, defaults[field]) for lead in leads] for field in fields]
+    except AttributeError:
+        # Some Lead tuples among the dicts
+        leads = [lead._asdict() if isinstance(lead, Lead) else lead for lead in leads]
+        return [[lead.get(field, defaults[field]) for lead in leads] for field in fields]
+
+
+def _stage_counts(conversion_matrix: Tuple[Tuple[float, ...], ...],
+                  segment_counts: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Per-segment counts at every funnel stage, starting from the Leads stage's counts
+    
+    Each stage applies its rates to the previous stage's counts and rounds (use round to
+    avoid truncation to 0). Multiplying the lead counts by cumulative rates instead would
+    drift by a lead here and there, so the per-stage rounding is kept.
+    """
+    stage_counts = [segment_counts]
+    for rates in conversion_matrix:
+        stage_counts.append(tuple(round(count * rate) for count, rate in zip(stage_counts[-1], rates)))
+    return tuple(stage_counts)
+
+
+def _segment_classifier(enterprise_criteria: Dict, midmarket_criteria: Dict) -> Callable[[float, int, float, int], int]:
+    """Segment-code classifier with the thresholds bound once (not memoized: hashing the key costs more than the comparisons)"""
+    ent_mrr = enterprise_criteria['mrr_threshold']
+    ent_users = enterprise_criteria['user_threshold']
+    ent_arr = enterprise_criteria['arr_threshold']
+    ent_score = enterprise_criteria['lead_score_min']
+    mid_mrr = midmarket_criteria['mrr_threshold']
+    mid_users = midmarket_criteria['user_threshold']
+    mid_arr = midmarket_criteria['arr_threshold']
+    mid_score = midmarket_criteria['lead_score_min']
+    
+    def classify(current_mrr, user_count, referral_arr, lead_score) -> int:
+        # Enterprise criteria (highest priority)
+        is_ent = (current_mrr >= ent_mrr or user_count >= ent_users or
+                  referral_arr >= ent_arr or lead_score >= ent_score)
+        # Midmarket criteria
+        is_mid = not is_ent and (current_mrr >= mid_mrr or user_count >= mid_users or
+                                 referral_arr >= mid_arr or lead_score >= mid_score)
+        # Codes are ranked (SMB=0, Midmarket=1, Enterprise=2), so the flags form the code directly
+        return (is_ent << 1) | is_mid
+    
+    return classify
+
+
+class Lead(NamedTuple):
+    """
+    A scored lead, with defaults applied once where it is ingested
+    
+    generate_funnel and categorize_lead take these or the equivalent lead-scoring dicts;
+    a batch of Lead tuples skips the per-field dict lookups.
+    """
+    account_id: str = ''
+    account_name: str = 'Unknown'
+    current_mrr: float = 0
+    user_count: int = 0
+    referral_arr: float = 0
+    lead_score: int = 0
+    qualification_tier: str = 'Unqualified'
+    
+    @classmethod
+    def from_dict(cls, lead: Dict) -> 'Lead':
+        """Build a Lead from a lead-scoring dict, filling missing fields with the defaults"""
+        return cls(**{field: lead[field] for field in cls._fields if field in lead})
 
 
 @dataclass
 class LeadCategory:
     """Lead categorization by segment"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): no per-instance __dict__
+    __slots__ = ('account_id', 'account_name', 'partner', 'segment_code', 'current_mrr', 'user_count',
+                 'referral_arr', 'lead_score', 'qualification_tier')
+    
     account_id: str
     account_name: str
     partner: str
-    segment: str  # Enterprise, Midmarket, SMB
+    segment_code: int  # Index into SEGMENT_NAMES (SMB, Midmarket, Enterprise)
     current_mrr: float
     user_count: int
     referral_arr: float
     lead_score: int
     qualification_tier: str  # Hot, Warm, Cold, Unqualified
+    
+    @property
+    def segment(self) -> str:
+        """Segment name: Enterprise, Midmarket, or SMB"""
+        return SEGMENT_NAMES[self.segment_code]
 
 
 @dataclass
 class FunnelMetrics:
     """Funnel stage metrics"""
+    __slots__ = ('stage', 'enterprise_count', 'midmarket_count', 'smb_count', 'total_count',
+                 'estimated_acv', 'conversion_rate', 'estimated_revenue')
+    
     stage: str
     enterprise_count: int
     midmarket_count: int
@@ -37,6 +173,73 @@ class FunnelMetrics:
     estimated_revenue: float  # Count * ACV * Conversion Rate
 
 
+class CategorizedLeads:
+    """
+    Categorized leads stored column-wise: one compact array (or list) per field
+    
+    Numeric fields and segment codes live in typed arrays rather than one LeadCategory
+    object per lead, so counting segments is a C-level scan. Indexing or iterating
+    yields LeadCategory rows for code that expects the old list of dataclasses.
+    """
+    
+    __slots__ = ('account_ids', 'account_names', 'partners', 'segments', 'current_mrr',
+                 'user_count', 'referral_arr', 'lead_score', 'qualification_tiers', '_segment_counts')
+    
+    def __init__(self):
+        self.account_ids: List[str] = []
+        self.account_names: List[str] = []
+        self.partners: List[str] = []
+        self.segments = array('B')  # Codes into SEGMENT_NAMES
+        self.current_mrr = array('d')
+        self.user_count = array('q')
+        self.referral_arr = array('d')
+        self.lead_score = array('q')
+        self.qualification_tiers: List[str] = []
+        # Running lead count per segment code, kept up to date by extend()
+        self._segment_counts = [0] * len(SEGMENT_NAMES)
+    
+    def extend(self, account_ids: Iterable[str], account_names: Iterable[str], partners: Iterable[str],
+               segments: array, current_mrr: Iterable[float], user_count: Iterable[int],
+               referral_arr: Iterable[float], lead_score: Iterable[int], qualification_tiers: Iterable[str]):
+        """Add a batch of categorized leads, one iterable per field (segments as codes into SEGMENT_NAMES)"""
+        self.account_ids.extend(account_ids)
+        self.account_names.extend(account_names)
+        self.partners.extend(partners)
+        self.segments.extend(segments)
+        for code in range(len(self._segment_counts)):
+            self._segment_counts[code] += segments.count(code)
+        self.current_mrr.extend(current_mrr)
+        self.user_count.extend(user_count)
+        self.referral_arr.extend(referral_arr)
+        self.lead_score.extend(lead_score)
+        self.qualification_tiers.extend(qualification_tiers)
+    
+    def segment_counts(self) -> Tuple[int, ...]:
+        """Number of leads per segment, indexed by segment code"""
+        return tuple(self._segment_counts)
+    
+    def __len__(self) -> int:
+        return len(self.segments)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[LeadCategory, List[LeadCategory]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return LeadCategory(
+            account_id=self.account_ids[index],
+            account_name=self.account_names[index],
+            partner=self.partners[index],
+            segment_code=self.segments[index],
+            current_mrr=self.current_mrr[index],
+            user_count=self.user_count[index],
+            referral_arr=self.referral_arr[index],
+            lead_score=self.lead_score[index],
+            qualification_tier=self.qualification_tiers[index]
+        )
+    
+    def __iter__(self) -> Iterator[LeadCategory]:
+        return (self[i] for i in range(len(self)))
+
+
 class UpmarketFunnelGenerator:
     """Generates upmarket sales funnel from partner leads"""
     
@@ -84,44 +287,50 @@ class UpmarketFunnelGenerator:
         }
     }
     
-    def categorize_lead(self, lead: Dict, partner: str) -> LeadCategory:
+    def _segment_classifier(self) -> Callable[[float, int, float, int], int]:
+        """Segment classifier for this generator's criteria"""
+        return _segment_classifier(self.ENTERPRISE_CRITERIA, self.MIDMARKET_CRITERIA)
+    
+    def categorize_lead(self, lead: Union[Lead, Dict], partner: str) -> LeadCategory:
         """
         Categorize a lead as Enterprise, Midmarket, or SMB
         
         Args:
-            lead: Dictionary with lead data (from lead scoring)
+            lead: Lead, or dictionary with lead data (from lead scoring)
             partner: Partner name
             
         Returns:
             LeadCategory object
         """
-        current_mrr = lead.get('current_mrr', 0)
-        user_count = lead.get('user_count', 0)
-        referral_arr = lead.get('referral_arr', 0)
-        lead_score = lead.get('lead_score', 0)
-        qualification_tier = lead.get('qualification_tier', 'Unqualified')
-        
-        # Determine segment based on criteria
-        segment = 'SMB'  # Default
+        if isinstance(lead, Lead):
+            account_id, account_name, current_mrr, user_count, referral_arr, lead_score, qualification_tier = lead
+        else:
+            account_id = lead.get('account_id', '')
+            account_name = lead.get('account_name', 'Unknown')
+            current_mrr = lead.get('current_mrr', 0)
+            user_count = lead.get('user_count', 0)
+            referral_arr = lead.get('referral_arr', 0)
+            lead_score = lead.get('lead_score', 0)
+            qualification_tier = lead.get('qualification_tier', 'Unqualified')
         
-        # Enterprise criteria (highest priority)
-        if (current_mrr >= self.ENTERPRISE_CRITERIA['mrr_threshold'] or
-            user_count >= self.ENTERPRISE_CRITERIA['user_threshold'] or
-            referral_arr >= self.ENTERPRISE_CRITERIA['arr_threshold'] or
-            lead_score >= self.ENTERPRISE_CRITERIA['lead_score_min']):
-            segment = 'Enterprise'
-        # Midmarket criteria
-        elif (current_mrr >= self.MIDMARKET_CRITERIA['mrr_threshold'] or
-              user_count >= self.MIDMARKET_CRITERIA['user_threshold'] or
-              referral_arr >= self.MIDMARKET_CRITERIA['arr_threshold'] or
-              lead_score >= self.MIDMARKET_CRITERIA['lead_score_min']):
-            segment = 'Midmarket'
+        # Determine segment based on criteria (SMB if below Midmarket thresholds); a single
+        # lead is checked against the criteria directly instead of binding a classifier
+        ent = self.ENTERPRISE_CRITERIA
+        mid = self.MIDMARKET_CRITERIA
+        if (current_mrr >= ent['mrr_threshold'] or user_count >= ent['user_threshold'] or
+                referral_arr >= ent['arr_threshold'] or lead_score >= ent['lead_score_min']):
+            segment_code = ENTERPRISE
+        elif (current_mrr >= mid['mrr_threshold'] or user_count >= mid['user_threshold'] or
+                referral_arr >= mid['arr_threshold'] or lead_score >= mid['lead_score_min']):
+            segment_code = MIDMARKET
+        else:
+            segment_code = SMB
         
         return LeadCategory(
-            account_id=str(lead.get('account_id', '')),
-            account_name=str(lead.get('account_name', 'Unknown')),
+            account_id=str(account_id),
+            account_name=str(account_name),
             partner=partner,
-            segment=segment,
+            segment_code=segment_code,
             current_mrr=float(current_mrr),
             user_count=int(user_count),
             referral_arr=float(referral_arr),
@@ -129,142 +338,98 @@ class UpmarketFunnelGenerator:
             qualification_tier=qualification_tier
         )
     
-    def generate_funnel(self, leads_by_partner: Dict[str, List[Dict]], current_quarter_target: float) -> Dict:
+    def _classify(self, columns: Sequence[Sequence]) -> array:
+        """Segment codes for (current_mrr, user_count, referral_arr, lead_score) columns, thresholds bound once per batch"""
+        return array('B', map(self._segment_classifier(), *columns))
+    
+    def _categorize_batch(self, categorized: CategorizedLeads, leads: List[Union[Lead, Dict]], partners: List[str]):
+        """
+        Categorize leads (with each lead's partner in partners) and add them to categorized
+        
+        Works column by column: each field is pulled out of the leads once, the classifier
+        is mapped over the raw numeric columns in a single pass, and the results are added to
+        the typed arrays in bulk rather than lead by lead.
+        """
+        (account_ids, account_names, current_mrr, user_count,
+         referral_arr, lead_score, qualification_tiers) = _lead_columns(leads, Lead._fields)
+        
+        # Determine segments based on criteria (SMB if below Midmarket thresholds)
+        segments = self._classify((current_mrr, user_count, referral_arr, lead_score))
+        
+        categorized.extend(
+            account_ids=map(str, account_ids),
+            account_names=map(str, account_names),
+            partners=partners,
+            segments=segments,
+            current_mrr=_typed_array('d', current_mrr, float),
+            user_count=_typed_array('q', user_count, int),
+            referral_arr=_typed_array('d', referral_arr, float),
+            lead_score=_typed_array('q', lead_score, int),
+            qualification_tiers=qualification_tiers
+        )
+    
+    def generate_funnel(self, leads_by_partner: Dict[str, List[Union[Lead, Dict]]], current_quarter_target: float,
+                        materialize_leads: bool = True) -> Dict:
         """
         Generate upmarket sales funnel metrics
         
         Args:
-            leads_by_partner: Dictionary with partner names as keys and lists of leads as values
+            leads_by_partner: Dictionary with partner names as keys and lists of leads (Lead tuples
+                or lead-scoring dicts) as values
             current_quarter_target: Revenue target for current quarter
+            materialize_leads: Include the per-lead CategorizedLeads under 'categorized_leads';
+                pass False when only the funnel counts are needed
             
         Returns:
             Dictionary with funnel data ready for Coda table
         """
-        # Categorize all leads
-        categorized_leads = []
-        for partner, leads in leads_by_partner.items():
-            for lead in leads:
-                categorized = self.categorize_lead(lead, partner)
-                categorized_leads.append(categorized)
-        
-        # Count by segment
-        enterprise_count = sum(1 for l in categorized_leads if l.segment == 'Enterprise')
-        midmarket_count = sum(1 for l in categorized_leads if l.segment == 'Midmarket')
-        smb_count = sum(1 for l in categorized_leads if l.segment == 'SMB')
-        total_leads = len(categorized_leads)
+        # Flatten every partner's leads into one batch
+        all_leads = list(chain.from_iterable(leads_by_partner.values()))
+        total_leads = len(all_leads)
         
-        # Calculate funnel stages
-        # Stage 1: Leads (starting point)
-        leads_stage = FunnelMetrics(
-            stage='Leads',
-            enterprise_count=enterprise_count,
-            midmarket_count=midmarket_count,
-            smb_count=smb_count,
-            total_count=total_leads,
-            estimated_acv=0,  # No ACV at lead stage
-            conversion_rate=1.0,  # 100% start here
-            estimated_revenue=0
-        )
+        if materialize_leads:
+            # Parallel column of partner names for the categorized leads
+            partners = list(chain.from_iterable(repeat(partner, len(leads)) for partner, leads in leads_by_partner.items()))
+            categorized_leads = CategorizedLeads()
+            self._categorize_batch(categorized_leads, all_leads, partners)
+            # Count by segment (tallied as leads are added, so no extra pass over the leads)
+            segment_counts = categorized_leads.segment_counts()
+        else:
+            # Counts only: classify without building any per-lead columns
+            segments = self._classify(_lead_columns(all_leads, _NUMERIC_FIELDS))
+            segment_counts = tuple(segments.count(code) for code in range(len(SEGMENT_NAMES)))
+        smb_count, midmarket_count, enterprise_count = segment_counts
         
-        # Stage 2: Qualified Leads (use round to avoid truncation to 0)
-        qualified_enterprise = round(enterprise_count * self.CONVERSION_RATES['Leads → Qualified']['Enterprise'])
-        qualified_midmarket = round(midmarket_count * self.CONVERSION_RATES['Leads → Qualified']['Midmarket'])
-        qualified_smb = round(smb_count * self.CONVERSION_RATES['Leads → Qualified']['SMB'])
-        qualified_total = qualified_enterprise + qualified_midmarket + qualified_smb
+        # Calculate funnel stages (Stage 1, Leads, is the segment counts above). The rates and
+        # ACVs are read from self on every call, so instance or in-place overrides take effect
+        stage_counts = _stage_counts(_conversion_matrix(self.CONVERSION_RATES), segment_counts)
         
-        qualified_stage = FunnelMetrics(
-            stage='Qualified',
-            enterprise_count=qualified_enterprise,
-            midmarket_count=qualified_midmarket,
-            smb_count=qualified_smb,
-            total_count=qualified_total,
-            estimated_acv=0,
-            conversion_rate=qualified_total / total_leads if total_leads > 0 else 0,
-            estimated_revenue=0
-        )
+        # Share of the previous stage that reached each stage (Leads is the 100% baseline)
+        totals = [sum(counts) for counts in stage_counts]
+        conversion_rates = ['100%'] + [
+            _fmt_pct(total / previous if previous > 0 else 0) for previous, total in zip(totals, totals[1:])
+        ]
         
-        # Stage 3: Opportunities
-        opp_enterprise = round(qualified_enterprise * self.CONVERSION_RATES['Qualified → Opportunity']['Enterprise'])
-        opp_midmarket = round(qualified_midmarket * self.CONVERSION_RATES['Qualified → Opportunity']['Midmarket'])
-        opp_smb = round(qualified_smb * self.CONVERSION_RATES['Qualified → Opportunity']['SMB'])
-        opp_total = opp_enterprise + opp_midmarket + opp_smb
-        
-        opportunities_stage = FunnelMetrics(
-            stage='Opportunities',
-            enterprise_count=opp_enterprise,
-            midmarket_count=opp_midmarket,
-            smb_count=opp_smb,
-            total_count=opp_total,
-            estimated_acv=0,
-            conversion_rate=opp_total / qualified_total if qualified_total > 0 else 0,
-            estimated_revenue=0
-        )
-        
-        # Stage 4: Closed Won (Revenue)
-        won_enterprise = round(opp_enterprise * self.CONVERSION_RATES['Opportunity → Closed Won']['Enterprise'])
-        won_midmarket = round(opp_midmarket * self.CONVERSION_RATES['Opportunity → Closed Won']['Midmarket'])
-        won_smb = round(opp_smb * self.CONVERSION_RATES['Opportunity → Closed Won']['SMB'])
-        won_total = won_enterprise + won_midmarket + won_smb
-        
-        # Calculate estimated revenue
-        estimated_revenue = (
-            won_enterprise * self.ESTIMATED_ACV['Enterprise'] +
-            won_midmarket * self.ESTIMATED_ACV['Midmarket'] +
-            won_smb * self.ESTIMATED_ACV['SMB']
-        )
-        
-        closed_won_stage = FunnelMetrics(
-            stage='Closed Won',
-            enterprise_count=won_enterprise,
-            midmarket_count=won_midmarket,
-            smb_count=won_smb,
-            total_count=won_total,
-            estimated_acv=self.ESTIMATED_ACV['Enterprise'],  # Weighted average
-            conversion_rate=won_total / opp_total if opp_total > 0 else 0,
-            estimated_revenue=estimated_revenue
-        )
+        # Calculate estimated revenue (only Closed Won deals carry revenue)
+        estimated_revenue = sum(count * acv for count, acv in zip(stage_counts[-1], _by_segment(self.ESTIMATED_ACV)))
+        revenues = ['$0'] * (len(FUNNEL_STAGES) - 1) + [_fmt_usd(estimated_revenue)]
         
         # Calculate progress toward target
         target_progress = (estimated_revenue / current_quarter_target * 100) if current_quarter_target > 0 else 0
         
-        return {
+        funnel = {
             'funnel_stages': [
                 {
-                    'Stage': 'Leads',
-                    'Enterprise': enterprise_count,
-                    'Midmarket': midmarket_count,
-                    'SMB': smb_count,
-                    'Total': total_leads,
-                    'Conversion Rate': '100%',
-                    'Estimated Revenue': '$0'
-                },
-                {
-                    'Stage': 'Qualified',
-                    'Enterprise': qualified_enterprise,
-                    'Midmarket': qualified_midmarket,
-                    'SMB': qualified_smb,
-                    'Total': qualified_total,
-                    'Conversion Rate': f'{qualified_stage.conversion_rate:.1%}',
-                    'Estimated Revenue': '$0'
-                },
-                {
-                    'Stage': 'Opportunities',
-                    'Enterprise': opp_enterprise,
-                    'Midmarket': opp_midmarket,
-                    'SMB': opp_smb,
-                    'Total': opp_total,
-                    'Conversion Rate': f'{opportunities_stage.conversion_rate:.1%}',
-                    'Estimated Revenue': '$0'
-                },
-                {
-                    'Stage': 'Closed Won',
-                    'Enterprise': won_enterprise,
-                    'Midmarket': won_midmarket,
-                    'SMB': won_smb,
-                    'Total': won_total,
-                    'Conversion Rate': f'{closed_won_stage.conversion_rate:.1%}',
-                    'Estimated Revenue': f'${estimated_revenue:,.0f}'
+                    'Stage': stage,
+                    'Enterprise': counts[ENTERPRISE],
+                    'Midmarket': counts[MIDMARKET],
+                    'SMB': counts[SMB],
+                    'Total': total,
+                    'Conversion Rate': conversion_rate,
+                    'Estimated Revenue': revenue
                 }
+                for stage, counts, total, conversion_rate, revenue
+                in zip(FUNNEL_STAGES, stage_counts, totals, conversion_rates, revenues)
             ],
             'summary': {
                 'Current Quarter Target': current_quarter_target,
@@ -275,9 +440,24 @@ class UpmarketFunnelGenerator:
                 'Estimated Revenue': estimated_revenue,
                 'Target Progress': f'{target_progress:.1f}%',
                 'Gap to Target': current_quarter_target - estimated_revenue
-            },
-            'categorized_leads': categorized_leads
+            }
         }
+        if materialize_leads:
+            funnel['categorized_leads'] = categorized_leads
+        return funnel
+
+
+# 2026 program revenue target per quarter (Q3/Q4 not set yet)
+QUARTER_TARGETS_2026 = (20000, 80000, 0, 0)
+
+
+@lru_cache(maxsize=None)
+def _target_for(year: int, month: int) -> float:
+    """Revenue target for the quarter containing the given month"""
+    if year == 2026:
+        return QUARTER_TARGETS_2026[(month - 1) // 3]
+    # Late 2025 (or any date outside the 2026 program) defaults to the Q1 2026 target
+    return QUARTER_TARGETS_2026[0]
 
 
 def get_current_quarter_target() -> float:
@@ -286,22 +466,5 @@ def get_current_quarter_target() -> float:
     For 2026: Q1 = $20K, Q2 = $80K
     Defaults to Q1 target if current date doesn't match a quarter
     """
-    from datetime import datetime
     current_date = datetime.now()
-    current_month = current_date.month
-    current_year = current_date.year
-    
-    # For 2026 program: Q1 = $20K, Q2 = $80K
-    # If we're in late 2025 or early 2026, default to Q1 2026
-    if current_year == 2025 or (current_year == 2026 and current_month <= 3):
-        return 20000  # Q1 2026 target
-    elif current_year == 2026 and 4 <= current_month <= 6:
-        return 80000  # Q2 2026 target
-    elif current_year == 2026 and 7 <= current_month <= 9:
-        return 0  # Q3 2026 target (not set yet)
-    elif current_year == 2026 and 10 <= current_month <= 12:
-        return 0  # Q4 2026 target (not set yet)
-    else:
-        # Default to Q1 2026 target
-        return 20000
-
+    return _target_for(current_date.year, current_date.month)